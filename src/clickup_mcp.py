@@ -17,6 +17,9 @@ Versão: 2.5.0
 import os
 import re
 import json
+import functools
+import heapq
+import orjson
 import httpx
 import asyncio
 import contextvars
@@ -24,7 +27,8 @@ import uuid
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from enum import Enum
-from collections import defaultdict
+from collections import Counter, defaultdict, deque
+from collections.abc import Sequence
 from pydantic import BaseModel, Field, ConfigDict
 from mcp.server.fastmcp import FastMCP
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
@@ -118,8 +122,25 @@ logger = logger.patch(lambda record: record["extra"].update(correlation_id=_corr
 # ============================================================================
 
 import statistics
-from time import perf_counter
-from contextlib import contextmanager
+from time import perf_counter_ns
+
+
+class _LatencyTimer:
+    """Context manager leve de latência (sem frame de gerador nem __dict__)."""
+
+    __slots__ = ("metrics", "tool_name", "start_ns")
+
+    def __init__(self, metrics: "Metrics", tool_name: Optional[str]):
+        self.metrics = metrics
+        self.tool_name = tool_name
+
+    def __enter__(self) -> "_LatencyTimer":
+        self.start_ns = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        elapsed_ms = (perf_counter_ns() - self.start_ns) / 1_000_000
+        self.metrics.record_latency(elapsed_ms, self.tool_name)
 
 
 class Metrics:
@@ -136,15 +157,18 @@ class Metrics:
         Args:
             max_latency_samples: Máximo de amostras de latência a manter (para memória)
         """
-        self.tool_calls: Dict[str, int] = defaultdict(int)
-        self.tool_errors: Dict[str, int] = defaultdict(int)
+        self.tool_calls: Counter = Counter()
+        self.tool_errors: Counter = Counter()
         self.cache_hits: int = 0
         self.cache_misses: int = 0
         self.api_calls: int = 0
         self.retries: int = 0
         self._max_samples = max_latency_samples
-        self._latencies: List[float] = []  # em milissegundos
-        self._tool_latencies: Dict[str, List[float]] = defaultdict(list)
+        # Buffers circulares: descartam a amostra mais antiga em O(1)
+        self._latencies: deque = deque(maxlen=max_latency_samples)  # em milissegundos
+        self._tool_latencies: Dict[str, deque] = defaultdict(
+            lambda: deque(maxlen=max_latency_samples // 10)  # Menos amostras por tool
+        )
 
     def record_tool_call(self, tool_name: str) -> None:
         """Registra chamada de tool."""
@@ -178,19 +202,13 @@ class Metrics:
             latency_ms: Latência em milissegundos
             tool_name: Nome da tool (opcional, para métricas por tool)
         """
-        # Mantém apenas as últimas N amostras
-        if len(self._latencies) >= self._max_samples:
-            self._latencies.pop(0)
+        # Mantém apenas as últimas N amostras (maxlen do deque)
         self._latencies.append(latency_ms)
 
         if tool_name:
-            tool_latencies = self._tool_latencies[tool_name]
-            if len(tool_latencies) >= self._max_samples // 10:  # Menos amostras por tool
-                tool_latencies.pop(0)
-            tool_latencies.append(latency_ms)
+            self._tool_latencies[tool_name].append(latency_ms)
 
-    @contextmanager
-    def measure_latency(self, tool_name: Optional[str] = None):
+    def measure_latency(self, tool_name: Optional[str] = None) -> _LatencyTimer:
         """
         Context manager para medir latência automaticamente.
 
@@ -198,14 +216,9 @@ class Metrics:
             with _metrics.measure_latency("get_tasks"):
                 result = await get_tasks(params)
         """
-        start = perf_counter()
-        try:
-            yield
-        finally:
-            elapsed_ms = (perf_counter() - start) * 1000
-            self.record_latency(elapsed_ms, tool_name)
+        return _LatencyTimer(self, tool_name)
 
-    def _calculate_percentiles(self, data: List[float]) -> Dict[str, float]:
+    def _calculate_percentiles(self, data: Sequence[float]) -> Dict[str, float]:
         """Calcula percentis de latência."""
         if not data:
             return {"p50": 0, "p95": 0, "p99": 0, "avg": 0, "min": 0, "max": 0}
@@ -241,11 +254,7 @@ class Metrics:
 
         # Latência por tool (top 5 mais chamadas)
         if self._tool_latencies:
-            top_tools = sorted(
-                self.tool_calls.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:5]
+            top_tools = self.tool_calls.most_common(5)
             summary["latency_by_tool"] = {
                 tool: self._calculate_percentiles(self._tool_latencies.get(tool, []))
                 for tool, _ in top_tools
@@ -326,9 +335,9 @@ _tasks_cache: TTLCache = TTLCache(maxsize=50, ttl=CACHE_TTL_TASKS)
 def cache_key(endpoint: str, params: Optional[Dict] = None) -> str:
     """Gera chave de cache única para endpoint + params usando hash."""
     import hashlib
-    params_str = json.dumps(params, sort_keys=True) if params else ""
-    raw = f"{endpoint}|{params_str}"
-    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+    params_bytes = orjson.dumps(params, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS) if params else b""
+    raw = endpoint.encode() + b"|" + params_bytes
+    return hashlib.sha256(raw).hexdigest()[:16]
 
 
 def get_cached(endpoint: str, params: Optional[Dict] = None, cache_type: str = "structure") -> Optional[Dict]:
@@ -544,8 +553,14 @@ def get_headers() -> Dict[str, str]:
             "Configure a variável de ambiente CLICKUP_API_TOKEN com seu token de API do ClickUp. "
             "Obtenha em: ClickUp → Settings → Apps → API Token"
         )
+    return _auth_headers(API_TOKEN)
+
+
+@functools.lru_cache(maxsize=1)
+def _auth_headers(token: str) -> Dict[str, str]:
+    """Monta os headers uma vez por token (não alterar o dict retornado)."""
     return {
-        "Authorization": API_TOKEN,
+        "Authorization": token,
         "Content-Type": "application/json"
     }
 
@@ -590,7 +605,13 @@ async def _make_request(
         if response.status_code == 204:
             return {"success": True}
 
-        result = response.json()
+        # orjson decodifica direto dos bytes (sem passar por str)
+        try:
+            result = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            # orjson rejeita surrogate isolado escapado (ex.: "\ud83d" de um
+            # emoji truncado no nome da task); o json da stdlib aceita
+            result = json.loads(response.text)
         if isinstance(result, dict):
             return sanitize_dict_values(result)
         return result
@@ -606,8 +627,8 @@ async def _make_request(
     except httpx.HTTPStatusError as e:
         error_detail = ""
         try:
-            error_detail = e.response.json()
-        except (json.JSONDecodeError, ValueError):
+            error_detail = orjson.loads(e.response.content)
+        except ValueError:
             error_detail = e.response.text
         raise NonRetryableError(f"Erro API ({e.response.status_code}): {error_detail}")
 
@@ -679,6 +700,37 @@ async def api_request(
 # FUNÇÕES AUXILIARES
 # ============================================================================
 
+def to_json(data: Any) -> str:
+    """
+    Serializa dados para o output JSON das tools.
+
+    Usa orjson (implementação nativa), relevante para listas grandes de tasks.
+    Para strings, ints, listas e dicts o texto é o mesmo de
+    json.dumps(data, indent=2, ensure_ascii=False); floats podem sair em outra
+    notação (1e16 em vez de 1e+16) e NaN/Infinity viram null.
+
+    Args:
+        data: Estrutura serializável (dict/list vindos da API)
+
+    Returns:
+        JSON indentado com 2 espaços, UTF-8 sem escape
+    """
+    try:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        # orjson.JSONEncodeError é TypeError: ints acima de 64 bits
+        # ou strings com surrogate isolado, que o json da stdlib aceita
+        return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+# Tabela de str.translate: remove caracteres de controle (exceto newline e tab) e DEL
+_CONTROL_CHARS_TABLE = dict.fromkeys(
+    [code for code in range(32) if chr(code) not in '\n\t'] + [127]
+)
+# Mesmo conjunto da tabela, para detectar rapidamente se há algo a remover
+_CONTROL_CHARS_RE = re.compile('[\x00-\x08\x0b-\x1f\x7f]')
+
+
 def sanitize_output(text: str) -> str:
     """
     Sanitiza texto de output para prevenir injection.
@@ -695,45 +747,52 @@ def sanitize_output(text: str) -> str:
     if not isinstance(text, str):
         text = str(text)
 
-    # Remove caracteres de controle (exceto newline e tab)
-    sanitized = ''.join(
-        char for char in text
-        if char in '\n\t' or (ord(char) >= 32 and ord(char) != 127)
-    )
+    # Limita tamanho para evitar DoS (antes de varrer, para não processar a cauda descartada)
+    truncated = len(text) > MAX_OUTPUT_LENGTH
+    if truncated:
+        text = text[:MAX_OUTPUT_LENGTH]
 
-    # Limita tamanho para evitar DoS
-    max_length = MAX_OUTPUT_LENGTH
-    if len(sanitized) > max_length:
-        sanitized = sanitized[:max_length] + "\n\n[... output truncado ...]"
+    # Remove caracteres de controle (exceto newline e tab); texto limpo não é copiado
+    if _CONTROL_CHARS_RE.search(text):
+        text = text.translate(_CONTROL_CHARS_TABLE)
 
-    return sanitized
+    if truncated:
+        text += "\n\n[... output truncado ...]"
+
+    return text
 
 
 def sanitize_dict_values(d: Dict[str, Any]) -> Dict[str, Any]:
     """
     Sanitiza valores string em um dicionário recursivamente.
 
+    Percorre a estrutura com uma pilha explícita (sem recursão) e devolve uma
+    cópia: o dicionário original não é alterado. Listas aninhadas em
+    qualquer nível também são percorridas.
+
     Args:
-        d: Dicionário a sanitizar
+        d: Dicionário a sanitizar (tipicamente JSON decodificado da API)
 
     Returns:
         Dicionário com valores sanitizados
     """
-    result = {}
-    for key, value in d.items():
-        if isinstance(value, str):
-            result[key] = sanitize_output(value)
-        elif isinstance(value, dict):
-            result[key] = sanitize_dict_values(value)
-        elif isinstance(value, list):
-            result[key] = [
-                sanitize_dict_values(item) if isinstance(item, dict)
-                else sanitize_output(item) if isinstance(item, str)
-                else item
-                for item in value
-            ]
-        else:
-            result[key] = value
+    result: Dict[str, Any] = {}
+    stack = [(d, result)]
+    while stack:
+        source, target = stack.pop()
+        entries = source.items() if type(source) is dict else enumerate(source)
+        for key, value in entries:
+            kind = type(value)
+            if kind is str:
+                target[key] = sanitize_output(value)
+            elif kind is dict:
+                target[key] = child = {}
+                stack.append((value, child))
+            elif kind is list:
+                target[key] = child = [None] * len(value)
+                stack.append((value, child))
+            else:
+                target[key] = value
     return result
 
 
@@ -766,19 +825,49 @@ def format_timestamp(ts: Optional[int]) -> Optional[str]:
     if ts is None:
         return None
     try:
-        dt = datetime.fromtimestamp(int(ts) / 1000)
-        return dt.strftime("%Y-%m-%d %H:%M:%S")
-    except (ValueError, TypeError, OSError):
-        return str(ts)
+        formatted = _format_timestamp_ms(int(ts))
+    except (ValueError, TypeError):
+        formatted = None
+    return formatted if formatted is not None else str(ts)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_timestamp_ms(ms: int) -> Optional[str]:
+    """
+    Formata timestamp (ms) já normalizado para int; None se fora do range.
+
+    Cacheado: as mesmas datas (criação, vencimento, ...) se repetem entre
+    tasks de uma mesma listagem.
+    """
+    try:
+        return datetime.fromtimestamp(ms / 1000).strftime("%Y-%m-%d %H:%M:%S")
+    except (ValueError, OSError, OverflowError):
+        return None
+
+
+# Campos opcionais simples de format_task_markdown, na ordem de exibição: (chave, rótulo)
+_TASK_DATE_FIELDS = (
+    ("date_created", "Criado em"),
+    ("date_updated", "Modificado em"),
+    ("due_date", "Prazo"),
+    ("start_date", "Início"),
+    ("date_closed", "Fechado em"),
+)
+_TASK_DURATION_FIELDS = (
+    ("time_estimate", "Tempo estimado"),
+    ("time_spent", "Tempo gasto"),
+)
+
 
 def format_task_markdown(task: Dict) -> str:
     """Formata uma task em Markdown com Tipo, Subtipo e hierarquia completa."""
     task_name = task.get('name', 'Sem nome')
-    lines = []
-    lines.append(f"## {task_name}")
-    lines.append(f"- **ID:** {task.get('id', 'N/A')}")
-    lines.append(f"- **Status:** {task.get('status', {}).get('status', 'N/A')}")
-    lines.append(f"- **URL:** {task.get('url', 'N/A')}")
+    lines = [
+        f"## {task_name}",
+        f"- **ID:** {task.get('id', 'N/A')}",
+        f"- **Status:** {task.get('status', {}).get('status', 'N/A')}",
+        f"- **URL:** {task.get('url', 'N/A')}",
+    ]
     
     # Extrai Tipo e Subtipo do nome
     tipo, subtipo = extract_tipo_subtipo(task_name)
@@ -788,22 +877,10 @@ def format_task_markdown(task: Dict) -> str:
         lines.append(f"- **Subtipo:** {subtipo}")
     
     # Datas
-    date_created = format_timestamp(task.get('date_created'))
-    date_updated = format_timestamp(task.get('date_updated'))
-    date_closed = format_timestamp(task.get('date_closed'))
-    due_date = format_timestamp(task.get('due_date'))
-    start_date = format_timestamp(task.get('start_date'))
-    
-    if date_created:
-        lines.append(f"- **Criado em:** {date_created}")
-    if date_updated:
-        lines.append(f"- **Modificado em:** {date_updated}")
-    if due_date:
-        lines.append(f"- **Prazo:** {due_date}")
-    if start_date:
-        lines.append(f"- **Início:** {start_date}")
-    if date_closed:
-        lines.append(f"- **Fechado em:** {date_closed}")
+    for key, label in _TASK_DATE_FIELDS:
+        formatted = format_timestamp(task.get(key))
+        if formatted:
+            lines.append(f"- **{label}:** {formatted}")
     
     # Prioridade
     priority = task.get('priority')
@@ -844,15 +921,17 @@ def format_task_markdown(task: Dict) -> str:
         lines.append(f"\n### Descrição\n{description}")
     
     # Time estimate e tracked
-    time_estimate = task.get('time_estimate')
-    time_spent = task.get('time_spent')
-    if time_estimate:
-        lines.append(f"- **Tempo estimado:** {time_estimate // 60000} min")
-    if time_spent:
-        lines.append(f"- **Tempo gasto:** {time_spent // 60000} min")
+    for key, label in _TASK_DURATION_FIELDS:
+        duration_ms = task.get(key)
+        if duration_ms:
+            lines.append(f"- **{label}:** {duration_ms // 60000} min")
     
     return "\n".join(lines)
 
+
+_NUMERIC_PREFIX_RE = re.compile(r'^\d+\s*-\s*')
+
+
 def extract_tipo_subtipo(task_name: str) -> tuple:
     """
     Extrai Tipo e Subtipo do nome da task.
@@ -871,15 +950,14 @@ def extract_tipo_subtipo(task_name: str) -> tuple:
         return (None, None)
     
     # Remove prefixos numéricos como "3 - " ou "15 - "
-    clean_name = re.sub(r'^\d+\s*-\s*', '', task_name.strip())
+    clean_name = _NUMERIC_PREFIX_RE.sub('', task_name.strip())
     
-    # Divide pelo separador " - "
-    parts = clean_name.split(' - ')
+    # Separa só as duas primeiras partes pelo separador " - " (sem lista intermediária)
+    tipo, sep, rest = clean_name.partition(' - ')
     
-    if len(parts) >= 2:
-        tipo = parts[0].strip()
-        subtipo = parts[1].strip()
-        return (tipo, subtipo)
+    if sep:
+        subtipo = rest.partition(' - ')[0]
+        return (tipo.strip(), subtipo.strip())
     else:
         # Não tem subtipo, o nome inteiro é o tipo
         return (clean_name.strip(), None)
@@ -895,22 +973,23 @@ def format_tasks_compact(tasks: List[Dict], total: int = 0, page: int = 0, limit
     if not tasks:
         return "Nenhuma task encontrada."
 
-    lines = [f"**{len(tasks)} tasks** (página {page}):\n"]
-
-    for i, task in enumerate(tasks, 1):
-        status = task.get('status', {}).get('status', '?')[:12]
-        name = task.get('name', 'Sem nome')[:60]
-        due = format_timestamp(task.get('due_date'))
-        due_str = due[:10] if due else '-'  # Só a data, sem hora
-        task_id = task.get('id', '')
+    n = len(tasks)
+    header = f"**{n} tasks** (página {page}):\n"
 
-        lines.append(f"{i}. [{status}] {name} | {due_str} | `{task_id}`")
+    # Uma linha por task, consumidas direto pelo join; prazo só com a data, sem hora
+    body = "\n".join(
+        f"{i}. [{task.get('status', {}).get('status', '?')[:12]}] "
+        f"{task.get('name', 'Sem nome')[:60]} | "
+        f"{(format_timestamp(task.get('due_date')) or '-')[:10]} | `{task.get('id', '')}`"
+        for i, task in enumerate(tasks, 1)
+    )
 
     # Aviso de paginação
-    if len(tasks) >= limit:
-        lines.append(f"\n_Mostrando {limit} de {total or '?'}. Use `page={page + 1}` para mais._")
+    if n >= limit:
+        footer = f"\n_Mostrando {limit} de {total or '?'}. Use `page={page + 1}` para mais._"
+        return "\n".join((header, body, footer))
 
-    return "\n".join(lines)
+    return f"{header}\n{body}"
 
 
 def format_tasks_detailed(tasks: List[Dict], total: int = 0, page: int = 0, limit: int = 25) -> str:
@@ -921,9 +1000,10 @@ def format_tasks_detailed(tasks: List[Dict], total: int = 0, page: int = 0, limi
     if not tasks:
         return "Nenhuma task encontrada."
 
+    n = len(tasks)
     lines = []
     if total:
-        lines.append(f"**Tasks retornadas:** {len(tasks)} de {total}")
+        lines.append(f"**Tasks retornadas:** {n} de {total}")
         lines.append("")
 
     for i, task in enumerate(tasks, 1):
@@ -939,9 +1019,11 @@ def format_tasks_detailed(tasks: List[Dict], total: int = 0, page: int = 0, limi
         list_info = task.get('list', {})
         folder_info = task.get('folder', {})
 
-        lines.append(f"### {i}. {task_name}")
-        lines.append(f"- ID: `{task.get('id')}`")
-        lines.append(f"- Status: {status}")
+        lines.extend((
+            f"### {i}. {task_name}",
+            f"- ID: `{task.get('id')}`",
+            f"- Status: {status}",
+        ))
 
         # Tipo e Subtipo
         if tipo:
@@ -977,23 +1059,22 @@ def format_tasks_detailed(tasks: List[Dict], total: int = 0, page: int = 0, limi
         lines.append("")
 
     # Aviso de paginação
-    if len(tasks) >= limit:
+    if n >= limit:
         lines.append(f"_Mostrando {limit} de {total or '?'}. Use `page={page + 1}` para mais._")
 
     return "\n".join(lines)
 
 
-# Alias para compatibilidade
-def format_tasks_list_markdown(tasks: List[Dict], total: int = 0, page: int = 0) -> str:
-    """Alias para format_tasks_detailed (compatibilidade)."""
-    return format_tasks_detailed(tasks, total, page)
+# Alias para compatibilidade (mesmo objeto: sem frame extra por chamada)
+format_tasks_list_markdown = format_tasks_detailed
 
 
 # ============================================================================
 # FUZZY SEARCH (Sprint 5) - Usando rapidfuzz para performance O(n)
 # ============================================================================
 
-from rapidfuzz import fuzz, process
+# rapidfuzz é importado dentro das funções: só a busca fuzzy usa, e o import
+# a frio (~8ms) não precisa pesar no startup do servidor
 
 
 def fuzzy_ratio(s1: str, s2: str) -> float:
@@ -1011,10 +1092,23 @@ def fuzzy_ratio(s1: str, s2: str) -> float:
     """
     if not s1 or not s2:
         return 0.0
+    from rapidfuzz import fuzz
     # rapidfuzz retorna 0-100, convertemos para 0-1
     return fuzz.ratio(s1.lower(), s2.lower()) / 100.0
 
 
+@functools.lru_cache(maxsize=32)
+def _normalized_names(names: tuple) -> tuple:
+    """
+    Normaliza nomes de tasks para busca fuzzy via utils.default_process.
+
+    Cacheado pela tupla de nomes: buscas sucessivas na mesma list (ex.: usuário
+    refinando a query) reaproveitam a normalização do corpus.
+    """
+    from rapidfuzz import utils
+    return tuple(utils.default_process(name) for name in names)
+
+
 def fuzzy_search_tasks(tasks: List[Dict], query: str, threshold: float = 0.4) -> List[Dict]:
     """
     Busca fuzzy em tasks por nome usando rapidfuzz.
@@ -1033,39 +1127,33 @@ def fuzzy_search_tasks(tasks: List[Dict], query: str, threshold: float = 0.4) ->
     if not tasks or not query:
         return []
 
-    # Cria mapeamento nome -> task para lookup rápido
-    task_map: Dict[str, Dict] = {}
-    names: List[str] = []
-
-    for task in tasks:
-        name = task.get('name', '')
-        if name:
-            # Usa ID como sufixo para garantir unicidade
-            key = f"{name}||{task.get('id', '')}"
-            task_map[key] = task
-            names.append(key)
-
-    if not names:
+    # Só tasks com nome participam; o índice retornado pelo extract aponta para cá
+    candidates = [task for task in tasks if task.get('name')]
+    if not candidates:
         return []
 
+    from rapidfuzz import fuzz, process, utils
+
     # Busca em lote com rapidfuzz - muito mais rápido
     # score_cutoff converte threshold de 0-1 para 0-100
+    normalized_query = utils.default_process(query)
+    names = _normalized_names(tuple(task['name'] for task in candidates))
+
+    # Query de 1 caractere: score fuzzy não discrimina nada, usa substring
+    if len(normalized_query) == 1:
+        return [task for task, name in zip(candidates, names, strict=True) if normalized_query in name]
+
+    # Nomes já normalizados por utils.default_process (lowercase, não alfanuméricos
+    # viram espaço, sem espaços nas pontas), assim como a query
     matches = process.extract(
-        query,
+        normalized_query,
         names,
         scorer=fuzz.WRatio,  # Weighted Ratio - melhor para buscas parciais
         score_cutoff=threshold * 100,
         limit=None  # Retorna todos acima do threshold
     )
 
-    # Converte resultados
-    results = []
-    for match_name, score, _ in matches:
-        task = task_map.get(match_name)
-        if task:
-            results.append(task)
-
-    return results
+    return [candidates[index] for _, _, index in matches]
 
 
 # ============================================================================
@@ -1077,7 +1165,7 @@ CLICKUP_ID_PATTERN = r'^[a-zA-Z0-9_\-]+$'
 
 class GetWorkspacesInput(BaseModel):
     """Input para listar workspaces."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     output_mode: OutputMode = Field(
         default=OutputMode.COMPACT,
         description="Modo de output: compact (1 linha), detailed (completo), json (raw)"
@@ -1085,7 +1173,7 @@ class GetWorkspacesInput(BaseModel):
 
 class GetSpacesInput(BaseModel):
     """Input para listar spaces de um workspace."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     team_id: str = Field(..., description="ID do workspace/team", min_length=1, pattern=CLICKUP_ID_PATTERN)
     archived: bool = Field(default=False, description="Incluir spaces arquivados")
     output_mode: OutputMode = Field(
@@ -1095,7 +1183,7 @@ class GetSpacesInput(BaseModel):
 
 class GetFoldersInput(BaseModel):
     """Input para listar folders de um space."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     space_id: str = Field(..., description="ID do space", min_length=1, pattern=CLICKUP_ID_PATTERN)
     archived: bool = Field(default=False, description="Incluir folders arquivados")
     output_mode: OutputMode = Field(
@@ -1105,7 +1193,7 @@ class GetFoldersInput(BaseModel):
 
 class GetListsInput(BaseModel):
     """Input para listar lists de um folder."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     folder_id: str = Field(..., description="ID do folder", min_length=1, pattern=CLICKUP_ID_PATTERN)
     archived: bool = Field(default=False, description="Incluir lists arquivadas")
     output_mode: OutputMode = Field(
@@ -1115,7 +1203,7 @@ class GetListsInput(BaseModel):
 
 class GetFolderlessListsInput(BaseModel):
     """Input para listar lists sem folder (diretamente no space)."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     space_id: str = Field(..., description="ID do space", min_length=1, pattern=CLICKUP_ID_PATTERN)
     archived: bool = Field(default=False, description="Incluir lists arquivadas")
     output_mode: OutputMode = Field(
@@ -1125,7 +1213,7 @@ class GetFolderlessListsInput(BaseModel):
 
 class GetTasksInput(BaseModel):
     """Input para listar tasks de uma list."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     list_id: str = Field(..., description="ID da list", min_length=1, pattern=CLICKUP_ID_PATTERN)
     archived: bool = Field(default=False, description="Incluir tasks arquivadas")
     include_closed: bool = Field(default=True, description="Incluir tasks fechadas")
@@ -1149,7 +1237,7 @@ class GetTasksInput(BaseModel):
 
 class GetFilteredTeamTasksInput(BaseModel):
     """Input para busca filtrada de tasks em todo o workspace."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     team_id: str = Field(..., description="ID do workspace/team", min_length=1, pattern=CLICKUP_ID_PATTERN)
     page: int = Field(default=0, description="Página (começa em 0)", ge=0)
     limit: int = Field(default=25, ge=1, le=100, description="Máximo de tasks a retornar (1-100)")
@@ -1175,14 +1263,14 @@ class GetFilteredTeamTasksInput(BaseModel):
 
 class GetTaskInput(BaseModel):
     """Input para buscar uma task específica."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     task_id: str = Field(..., description="ID da task", min_length=1, pattern=CLICKUP_ID_PATTERN)
     include_subtasks: bool = Field(default=True, description="Incluir subtasks")
     response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN)
 
 class CreateTaskInput(BaseModel):
     """Input para criar uma nova task."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     list_id: str = Field(..., description="ID da list onde criar a task", min_length=1, pattern=CLICKUP_ID_PATTERN)
     name: str = Field(..., description="Nome da task", min_length=1, max_length=500)
     description: Optional[str] = Field(default=None, description="Descrição da task")
@@ -1205,7 +1293,7 @@ class CreateTaskInput(BaseModel):
 
 class UpdateTaskInput(BaseModel):
     """Input para atualizar uma task existente."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     task_id: str = Field(..., description="ID da task a atualizar", min_length=1, pattern=CLICKUP_ID_PATTERN)
     name: Optional[str] = Field(default=None, description="Novo nome da task")
     description: Optional[str] = Field(default=None, description="Nova descrição")
@@ -1223,21 +1311,21 @@ class UpdateTaskInput(BaseModel):
 
 class DeleteTaskInput(BaseModel):
     """Input para deletar uma task."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     task_id: str = Field(..., description="ID da task a deletar", min_length=1, pattern=CLICKUP_ID_PATTERN)
 
 # REMOVIDO: MoveTaskInput (tool move_task removida - limitação API ClickUp)
 
 class DuplicateTaskInput(BaseModel):
     """Input para duplicar uma task."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     task_id: str = Field(..., description="ID da task a duplicar", min_length=1, pattern=CLICKUP_ID_PATTERN)
     list_id: str = Field(..., description="ID da list de destino", min_length=1, pattern=CLICKUP_ID_PATTERN)
     name: Optional[str] = Field(default=None, description="Nome da cópia (opcional)")
 
 class CreateListInput(BaseModel):
     """Input para criar uma nova list."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     folder_id: Optional[str] = Field(default=None, description="ID do folder (se dentro de folder)")
     space_id: Optional[str] = Field(default=None, description="ID do space (se folderless)")
     name: str = Field(..., description="Nome da list", min_length=1, max_length=200)
@@ -1249,7 +1337,7 @@ class CreateListInput(BaseModel):
 
 class UpdateListInput(BaseModel):
     """Input para atualizar uma list."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     list_id: str = Field(..., description="ID da list a atualizar", min_length=1, pattern=CLICKUP_ID_PATTERN)
     name: Optional[str] = Field(default=None, description="Novo nome")
     content: Optional[str] = Field(default=None, description="Nova descrição")
@@ -1260,31 +1348,31 @@ class UpdateListInput(BaseModel):
 
 class DeleteListInput(BaseModel):
     """Input para deletar uma list."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     list_id: str = Field(..., description="ID da list a deletar", min_length=1, pattern=CLICKUP_ID_PATTERN)
 
 class CreateFolderInput(BaseModel):
     """Input para criar um novo folder."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     space_id: str = Field(..., description="ID do space", min_length=1, pattern=CLICKUP_ID_PATTERN)
     name: str = Field(..., description="Nome do folder", min_length=1, max_length=200)
     response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN)
 
 class UpdateFolderInput(BaseModel):
     """Input para atualizar um folder."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     folder_id: str = Field(..., description="ID do folder a atualizar", min_length=1, pattern=CLICKUP_ID_PATTERN)
     name: str = Field(..., description="Novo nome do folder", min_length=1, max_length=200)
     response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN)
 
 class DeleteFolderInput(BaseModel):
     """Input para deletar um folder."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     folder_id: str = Field(..., description="ID do folder a deletar", min_length=1, pattern=CLICKUP_ID_PATTERN)
 
 class SearchTasksInput(BaseModel):
     """Input para busca de tasks por texto."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     team_id: str = Field(..., description="ID do workspace/team", min_length=1, pattern=CLICKUP_ID_PATTERN)
     query: str = Field(..., description="Texto para buscar", min_length=1)
     response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN)
@@ -1292,7 +1380,7 @@ class SearchTasksInput(BaseModel):
 
 class FuzzySearchTasksInput(BaseModel):
     """Input para busca fuzzy de tasks (Sprint 5)."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     list_id: str = Field(..., description="ID da list onde buscar", min_length=1, pattern=CLICKUP_ID_PATTERN)
     query: str = Field(..., description="Texto aproximado para buscar (ex: 'relatorio' encontra 'Relatório Mensal')", min_length=1)
     threshold: float = Field(
@@ -1310,7 +1398,7 @@ class FuzzySearchTasksInput(BaseModel):
 
 class GetTaskCommentsInput(BaseModel):
     """Input para buscar comentários de uma task."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     task_id: str = Field(..., description="ID da task", min_length=1, pattern=CLICKUP_ID_PATTERN)
     output_mode: OutputMode = Field(
         default=OutputMode.COMPACT,
@@ -1319,7 +1407,7 @@ class GetTaskCommentsInput(BaseModel):
 
 class CreateTaskCommentInput(BaseModel):
     """Input para criar comentário em uma task."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     task_id: str = Field(..., description="ID da task", min_length=1, pattern=CLICKUP_ID_PATTERN)
     comment_text: str = Field(..., description="Texto do comentário", min_length=1)
     assignee: Optional[int] = Field(default=None, description="ID do usuário a mencionar")
@@ -1328,7 +1416,7 @@ class CreateTaskCommentInput(BaseModel):
 
 class GetTimeEntriesInput(BaseModel):
     """Input para buscar time entries."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     team_id: str = Field(..., description="ID do workspace/team", min_length=1, pattern=CLICKUP_ID_PATTERN)
     start_date: Optional[int] = Field(default=None, description="Data início (timestamp ms)")
     end_date: Optional[int] = Field(default=None, description="Data fim (timestamp ms)")
@@ -1340,7 +1428,7 @@ class GetTimeEntriesInput(BaseModel):
 
 class GetMembersInput(BaseModel):
     """Input para buscar membros do workspace."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     team_id: str = Field(..., description="ID do workspace/team", min_length=1, pattern=CLICKUP_ID_PATTERN)
     output_mode: OutputMode = Field(
         default=OutputMode.COMPACT,
@@ -1350,7 +1438,7 @@ class GetMembersInput(BaseModel):
 
 class CreateTimeEntryInput(BaseModel):
     """Input para criar time entry (Sprint 5)."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     team_id: str = Field(..., description="ID do workspace/team", min_length=1, pattern=CLICKUP_ID_PATTERN)
     task_id: Optional[str] = Field(default=None, description="ID da task (opcional)")
     description: Optional[str] = Field(default=None, description="Descrição do trabalho realizado")
@@ -1363,7 +1451,7 @@ class CreateTimeEntryInput(BaseModel):
 
 class GetBillableReportInput(BaseModel):
     """Input para relatório de horas faturáveis (Sprint 5)."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     team_id: str = Field(..., description="ID do workspace/team", min_length=1, pattern=CLICKUP_ID_PATTERN)
     start_date: int = Field(..., description="Data início (timestamp ms)")
     end_date: int = Field(..., description="Data fim (timestamp ms)")
@@ -1399,7 +1487,7 @@ async def get_workspaces(params: GetWorkspacesInput) -> str:
         teams = data.get("teams", [])
 
         if params.output_mode == OutputMode.JSON:
-            return json.dumps(data, indent=2, ensure_ascii=False)
+            return to_json(data)
 
         if params.output_mode == OutputMode.COMPACT:
             lines = [f"**{len(teams)} workspaces:**\n"]
@@ -1448,7 +1536,7 @@ async def get_spaces(params: GetSpacesInput) -> str:
         spaces = data.get("spaces", [])
 
         if params.output_mode == OutputMode.JSON:
-            return json.dumps(data, indent=2, ensure_ascii=False)
+            return to_json(data)
 
         if params.output_mode == OutputMode.COMPACT:
             lines = [f"**{len(spaces)} spaces:**\n"]
@@ -1500,7 +1588,7 @@ async def get_folders(params: GetFoldersInput) -> str:
         folders = data.get("folders", [])
 
         if params.output_mode == OutputMode.JSON:
-            return json.dumps(data, indent=2, ensure_ascii=False)
+            return to_json(data)
 
         if params.output_mode == OutputMode.COMPACT:
             lines = [f"**{len(folders)} folders:**\n"]
@@ -1552,7 +1640,7 @@ async def create_folder(params: CreateFolderInput) -> str:
         )
         
         if params.response_format == ResponseFormat.JSON:
-            return json.dumps(data, indent=2, ensure_ascii=False)
+            return to_json(data)
         
         return f"✅ Folder '{data.get('name')}' criado com sucesso!\n- **ID:** `{data.get('id')}`"
     except Exception as e:
@@ -1584,7 +1672,7 @@ async def update_folder(params: UpdateFolderInput) -> str:
         )
         
         if params.response_format == ResponseFormat.JSON:
-            return json.dumps(data, indent=2, ensure_ascii=False)
+            return to_json(data)
         
         return f"✅ Folder atualizado para '{data.get('name')}'"
     except Exception as e:
@@ -1640,7 +1728,7 @@ async def get_lists(params: GetListsInput) -> str:
         lists = data.get("lists", [])
 
         if params.output_mode == OutputMode.JSON:
-            return json.dumps(data, indent=2, ensure_ascii=False)
+            return to_json(data)
 
         if params.output_mode == OutputMode.COMPACT:
             lines = [f"**{len(lists)} lists:**\n"]
@@ -1684,7 +1772,7 @@ async def get_folderless_lists(params: GetFolderlessListsInput) -> str:
         lists = data.get("lists", [])
 
         if params.output_mode == OutputMode.JSON:
-            return json.dumps(data, indent=2, ensure_ascii=False)
+            return to_json(data)
 
         if params.output_mode == OutputMode.COMPACT:
             lines = [f"**{len(lists)} lists (sem folder):**\n"]
@@ -1746,7 +1834,7 @@ async def create_list(params: CreateListInput) -> str:
         data = await api_request("POST", endpoint, json_data=json_data)
         
         if params.response_format == ResponseFormat.JSON:
-            return json.dumps(data, indent=2, ensure_ascii=False)
+            return to_json(data)
         
         return f"✅ List '{data.get('name')}' criada com sucesso!\n- **ID:** `{data.get('id')}`"
     except Exception as e:
@@ -1786,7 +1874,7 @@ async def update_list(params: UpdateListInput) -> str:
         data = await api_request("PUT", f"/list/{params.list_id}", json_data=json_data)
         
         if params.response_format == ResponseFormat.JSON:
-            return json.dumps(data, indent=2, ensure_ascii=False)
+            return to_json(data)
         
         return f"✅ List '{data.get('name')}' atualizada com sucesso!"
     except Exception as e:
@@ -1880,7 +1968,7 @@ async def get_tasks(params: GetTasksInput) -> str:
 
         # Formata conforme output_mode
         if params.output_mode == OutputMode.JSON:
-            return json.dumps({"tasks": tasks, "total": total, "page": params.page}, indent=2, ensure_ascii=False)
+            return to_json({"tasks": tasks, "total": total, "page": params.page})
         elif params.output_mode == OutputMode.DETAILED:
             return format_tasks_detailed(tasks, total, params.page, params.limit)
         else:  # COMPACT (default)
@@ -1947,12 +2035,12 @@ async def fuzzy_search_tasks_tool(params: FuzzySearchTasksInput) -> str:
 
         # Formata conforme output_mode
         if params.output_mode == OutputMode.JSON:
-            return json.dumps({
+            return to_json({
                 "query": params.query,
                 "threshold": params.threshold,
                 "total_matches": total_matches,
                 "tasks": matched_tasks
-            }, indent=2, ensure_ascii=False)
+            })
         elif params.output_mode == OutputMode.DETAILED:
             header = f"**Busca fuzzy:** '{params.query}' ({total_matches} resultados)\n\n"
             return header + format_tasks_detailed(matched_tasks, total_matches, 0, params.limit)
@@ -2030,7 +2118,7 @@ async def get_filtered_team_tasks(params: GetFilteredTeamTasksInput) -> str:
 
         # Formata conforme output_mode
         if params.output_mode == OutputMode.JSON:
-            return json.dumps({"tasks": tasks, "total": total, "page": params.page}, indent=2, ensure_ascii=False)
+            return to_json({"tasks": tasks, "total": total, "page": params.page})
         elif params.output_mode == OutputMode.DETAILED:
             return format_tasks_detailed(tasks, total, params.page, params.limit)
         else:  # COMPACT (default)
@@ -2060,7 +2148,7 @@ async def get_task(params: GetTaskInput) -> str:
         data = await api_request("GET", f"/task/{params.task_id}", params=query_params)
         
         if params.response_format == ResponseFormat.JSON:
-            return json.dumps(data, indent=2, ensure_ascii=False)
+            return to_json(data)
         
         return format_task_markdown(data)
     except Exception as e:
@@ -2119,7 +2207,7 @@ async def create_task(params: CreateTaskInput) -> str:
         data = await api_request("POST", f"/list/{params.list_id}/task", json_data=json_data)
 
         if params.response_format == ResponseFormat.JSON:
-            return json.dumps(data, indent=2, ensure_ascii=False)
+            return to_json(data)
 
         return f"✅ Task '{data.get('name')}' criada com sucesso!\n- **ID:** `{data.get('id')}`\n- **URL:** {data.get('url')}"
     except Exception as e:
@@ -2176,7 +2264,7 @@ async def update_task(params: UpdateTaskInput) -> str:
         data = await api_request("PUT", f"/task/{params.task_id}", json_data=json_data)
         
         if params.response_format == ResponseFormat.JSON:
-            return json.dumps(data, indent=2, ensure_ascii=False)
+            return to_json(data)
         
         return f"✅ Task '{data.get('name')}' atualizada com sucesso!"
     except Exception as e:
@@ -2287,7 +2375,7 @@ async def get_task_comments(params: GetTaskCommentsInput) -> str:
         comments = data.get("comments", [])
 
         if params.output_mode == OutputMode.JSON:
-            return json.dumps(data, indent=2, ensure_ascii=False)
+            return to_json(data)
 
         if not comments:
             return "Nenhum comentário encontrado."
@@ -2343,7 +2431,7 @@ async def create_task_comment(params: CreateTaskCommentInput) -> str:
         data = await api_request("POST", f"/task/{params.task_id}/comment", json_data=json_data)
         
         if params.response_format == ResponseFormat.JSON:
-            return json.dumps(data, indent=2, ensure_ascii=False)
+            return to_json(data)
         
         return "✅ Comentário adicionado com sucesso!"
     except Exception as e:
@@ -2387,7 +2475,7 @@ async def get_workspace_members(params: GetMembersInput) -> str:
         members = team.get("members", [])
 
         if params.output_mode == OutputMode.JSON:
-            return json.dumps({"members": members}, indent=2, ensure_ascii=False)
+            return to_json({"members": members})
 
         if params.output_mode == OutputMode.COMPACT:
             lines = [f"**{len(members)} membros:**\n"]
@@ -2445,7 +2533,7 @@ async def get_time_entries(params: GetTimeEntriesInput) -> str:
         entries = data.get("data", [])
 
         if params.output_mode == OutputMode.JSON:
-            return json.dumps(data, indent=2, ensure_ascii=False)
+            return to_json(data)
 
         if not entries:
             return "Nenhum registro de tempo encontrado."
@@ -2530,7 +2618,7 @@ async def create_time_entry(params: CreateTimeEntryInput) -> str:
         billable_icon = "💰" if params.billable else "⏱️"
 
         if params.response_format == ResponseFormat.JSON:
-            return json.dumps(data, indent=2, ensure_ascii=False)
+            return to_json(data)
 
         return (
             f"✅ Time entry criado!\n"
@@ -2584,21 +2672,16 @@ async def get_billable_report(params: GetBillableReportInput) -> str:
         billable_entries = [e for e in all_entries if e.get("billable", False)]
 
         if params.output_mode == OutputMode.JSON:
-            return json.dumps({
+            return to_json({
                 "total_entries": len(all_entries),
                 "billable_entries": len(billable_entries),
                 "entries": billable_entries
-            }, indent=2, ensure_ascii=False)
+            })
 
         if not billable_entries:
             return "Nenhuma hora faturável encontrada no período."
 
-        # Calcula totais
-        total_ms = sum(int(e.get("duration", 0)) for e in billable_entries)
-        total_hours = total_ms / 3600000
-        total_minutes = (total_ms % 3600000) // 60000
-
-        # Agrupa por usuário
+        # Agrupa por usuário e por task em uma única passada
         by_user: Dict[str, int] = defaultdict(int)
         by_task: Dict[str, int] = defaultdict(int)
 
@@ -2610,6 +2693,11 @@ async def get_billable_report(params: GetBillableReportInput) -> str:
             by_user[user] += duration
             by_task[task] += duration
 
+        # Calcula totais
+        total_ms = sum(by_user.values())
+        total_hours = total_ms / 3600000
+        total_minutes = (total_ms % 3600000) // 60000
+
         if params.output_mode == OutputMode.COMPACT:
             return (
                 f"**💰 Horas Faturáveis** | "
@@ -2638,7 +2726,7 @@ async def get_billable_report(params: GetBillableReportInput) -> str:
             lines.append(f"- **{user}:** {h}h {m}min")
 
         lines.append("\n## Por Task (Top 10)")
-        sorted_tasks = sorted(by_task.items(), key=lambda x: -x[1])[:10]
+        sorted_tasks = heapq.nlargest(10, by_task.items(), key=lambda x: x[1])
         for task, ms in sorted_tasks:
             h = ms // 3600000
             m = (ms % 3600000) // 60000
@@ -2655,7 +2743,7 @@ async def get_billable_report(params: GetBillableReportInput) -> str:
 
 class GetCustomFieldsInput(BaseModel):
     """Input para listar custom fields de uma list."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     list_id: str = Field(..., description="ID da list", min_length=1, pattern=CLICKUP_ID_PATTERN)
     output_mode: OutputMode = Field(
         default=OutputMode.COMPACT,
@@ -2686,7 +2774,7 @@ async def get_custom_fields(params: GetCustomFieldsInput) -> str:
         fields = data.get("fields", [])
 
         if params.output_mode == OutputMode.JSON:
-            return json.dumps(data, indent=2, ensure_ascii=False)
+            return to_json(data)
 
         if not fields:
             return "Nenhum campo customizado encontrado nesta list."
@@ -2723,7 +2811,7 @@ async def get_custom_fields(params: GetCustomFieldsInput) -> str:
 
 class GetSpaceDetailsInput(BaseModel):
     """Input para buscar detalhes de um space."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     space_id: str = Field(..., description="ID do space", min_length=1, pattern=CLICKUP_ID_PATTERN)
     output_mode: OutputMode = Field(
         default=OutputMode.DETAILED,
@@ -2753,7 +2841,7 @@ async def get_space_details(params: GetSpaceDetailsInput) -> str:
         data = await api_request("GET", f"/space/{params.space_id}")
 
         if params.output_mode == OutputMode.JSON:
-            return json.dumps(data, indent=2, ensure_ascii=False)
+            return to_json(data)
 
         name = data.get('name', 'Sem nome')
         space_id = data.get('id', '')
@@ -2801,7 +2889,7 @@ async def get_space_details(params: GetSpaceDetailsInput) -> str:
 
 class GetListDetailsInput(BaseModel):
     """Input para buscar detalhes de uma list."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     list_id: str = Field(..., description="ID da list", min_length=1, pattern=CLICKUP_ID_PATTERN)
     output_mode: OutputMode = Field(
         default=OutputMode.DETAILED,
@@ -2831,7 +2919,7 @@ async def get_list_details(params: GetListDetailsInput) -> str:
         data = await api_request("GET", f"/list/{params.list_id}")
 
         if params.output_mode == OutputMode.JSON:
-            return json.dumps(data, indent=2, ensure_ascii=False)
+            return to_json(data)
 
         name = data.get('name', 'Sem nome')
         list_id = data.get('id', '')
@@ -2881,7 +2969,7 @@ async def get_list_details(params: GetListDetailsInput) -> str:
 
 class GetChecklistsInput(BaseModel):
     """Input para buscar checklists de uma task."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     task_id: str = Field(..., description="ID da task", min_length=1, pattern=CLICKUP_ID_PATTERN)
     output_mode: OutputMode = Field(
         default=OutputMode.DETAILED,
@@ -2913,7 +3001,7 @@ async def get_checklists(params: GetChecklistsInput) -> str:
         checklists = data.get("checklists", [])
 
         if params.output_mode == OutputMode.JSON:
-            return json.dumps({"checklists": checklists}, indent=2, ensure_ascii=False)
+            return to_json({"checklists": checklists})
 
         if not checklists:
             return "Nenhuma checklist encontrada nesta task."
@@ -2956,7 +3044,7 @@ async def get_checklists(params: GetChecklistsInput) -> str:
 
 class GetAttachmentsInput(BaseModel):
     """Input para buscar anexos de uma task."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     task_id: str = Field(..., description="ID da task", min_length=1, pattern=CLICKUP_ID_PATTERN)
     output_mode: OutputMode = Field(
         default=OutputMode.COMPACT,
@@ -2985,7 +3073,7 @@ async def get_attachments(params: GetAttachmentsInput) -> str:
         attachments = data.get("attachments", [])
 
         if params.output_mode == OutputMode.JSON:
-            return json.dumps({"attachments": attachments}, indent=2, ensure_ascii=False)
+            return to_json({"attachments": attachments})
 
         if not attachments:
             return "Nenhum anexo encontrado nesta task."
@@ -3027,7 +3115,7 @@ async def get_attachments(params: GetAttachmentsInput) -> str:
 
 class AnalyzeSpaceStructureInput(BaseModel):
     """Input para análise morfológica do space."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     space_id: str = Field(..., description="ID do space", min_length=1, pattern=CLICKUP_ID_PATTERN)
     include_tasks_count: bool = Field(default=True, description="Incluir contagem de tasks por list")
     output_mode: OutputMode = Field(
@@ -3116,7 +3204,7 @@ async def analyze_space_structure(params: AnalyzeSpaceStructureInput) -> str:
                 "total_lists": total_lists,
                 "total_tasks": total_tasks
             }
-            return json.dumps(structure, indent=2, ensure_ascii=False)
+            return to_json(structure)
 
         if params.output_mode == OutputMode.COMPACT:
             return (
@@ -3166,7 +3254,7 @@ async def analyze_space_structure(params: AnalyzeSpaceStructureInput) -> str:
 
 class GetDocsInput(BaseModel):
     """Input para listar docs de um workspace."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     workspace_id: str = Field(..., description="ID do workspace", min_length=1, pattern=CLICKUP_ID_PATTERN)
     output_mode: OutputMode = Field(
         default=OutputMode.COMPACT,
@@ -3210,7 +3298,7 @@ async def get_docs(params: GetDocsInput) -> str:
             docs = []
 
         if params.output_mode == OutputMode.JSON:
-            return json.dumps(data, indent=2, ensure_ascii=False)
+            return to_json(data)
 
         if not docs:
             return "Nenhum documento encontrado neste workspace."
@@ -3250,7 +3338,7 @@ async def get_docs(params: GetDocsInput) -> str:
 
 class CreateDocInput(BaseModel):
     """Input para criar um documento."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     workspace_id: str = Field(..., description="ID do workspace", min_length=1, pattern=CLICKUP_ID_PATTERN)
     name: str = Field(..., description="Nome do documento", min_length=1)
     content: Optional[str] = Field(default=None, description="Conteúdo inicial do documento (markdown)")
@@ -3316,7 +3404,7 @@ async def create_doc(params: CreateDocInput) -> str:
 
 class GetMetricsInput(BaseModel):
     """Input para buscar métricas do servidor."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     output_mode: OutputMode = Field(
         default=OutputMode.DETAILED,
         description="Modo de output: compact (resumo), detailed (completo), json (raw)"
@@ -3349,7 +3437,7 @@ async def get_metrics(params: GetMetricsInput) -> str:
     summary["operation_mode"] = operation_mode
 
     if params.output_mode == OutputMode.JSON:
-        return json.dumps(summary, indent=2, ensure_ascii=False)
+        return to_json(summary)
 
     if params.output_mode == OutputMode.COMPACT:
         mode_icon = "🔒" if READ_ONLY_MODE else "✏️"
@@ -3394,7 +3482,7 @@ async def get_metrics(params: GetMetricsInput) -> str:
 
 class SetCustomFieldValueInput(BaseModel):
     """Input para definir valor de um custom field em uma task."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     task_id: str = Field(..., description="ID da task", min_length=1, pattern=CLICKUP_ID_PATTERN)
     field_id: str = Field(..., description="ID do custom field (use clickup_get_custom_fields para obter)", min_length=1, pattern=CLICKUP_ID_PATTERN)
     value: Any = Field(
@@ -3457,7 +3545,7 @@ async def set_custom_field_value(params: SetCustomFieldValueInput) -> str:
 
 class RemoveCustomFieldValueInput(BaseModel):
     """Input para remover valor de um custom field."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     task_id: str = Field(..., description="ID da task", min_length=1, pattern=CLICKUP_ID_PATTERN)
     field_id: str = Field(..., description="ID do custom field", min_length=1, pattern=CLICKUP_ID_PATTERN)
 
@@ -3495,7 +3583,7 @@ async def remove_custom_field_value(params: RemoveCustomFieldValueInput) -> str:
 
 class GetSpaceTagsInput(BaseModel):
     """Input para listar tags de um space."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     space_id: str = Field(..., description="ID do space", min_length=1, pattern=CLICKUP_ID_PATTERN)
     output_mode: OutputMode = Field(default=OutputMode.COMPACT, description="Modo de output")
 
@@ -3521,7 +3609,7 @@ async def get_space_tags(params: GetSpaceTagsInput) -> str:
         tags = data.get("tags", [])
 
         if params.output_mode == OutputMode.JSON:
-            return json.dumps(data, indent=2, ensure_ascii=False)
+            return to_json(data)
 
         if not tags:
             return "Nenhuma tag encontrada neste space."
@@ -3548,7 +3636,7 @@ async def get_space_tags(params: GetSpaceTagsInput) -> str:
 
 class CreateSpaceTagInput(BaseModel):
     """Input para criar tag em um space."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     space_id: str = Field(..., description="ID do space", min_length=1, pattern=CLICKUP_ID_PATTERN)
     name: str = Field(..., description="Nome da tag", min_length=1, max_length=100)
     tag_fg: Optional[str] = Field(default=None, description="Cor do texto (hex, ex: #FFFFFF)")
@@ -3589,7 +3677,7 @@ async def create_space_tag(params: CreateSpaceTagInput) -> str:
 
 class UpdateSpaceTagInput(BaseModel):
     """Input para atualizar tag de um space."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     space_id: str = Field(..., description="ID do space", min_length=1, pattern=CLICKUP_ID_PATTERN)
     tag_name: str = Field(..., description="Nome atual da tag", min_length=1)
     new_name: Optional[str] = Field(default=None, description="Novo nome da tag")
@@ -3632,7 +3720,7 @@ async def update_space_tag(params: UpdateSpaceTagInput) -> str:
 
 class DeleteSpaceTagInput(BaseModel):
     """Input para deletar tag de um space."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     space_id: str = Field(..., description="ID do space", min_length=1, pattern=CLICKUP_ID_PATTERN)
     tag_name: str = Field(..., description="Nome da tag a deletar", min_length=1)
 
@@ -3665,7 +3753,7 @@ async def delete_space_tag(params: DeleteSpaceTagInput) -> str:
 
 class AddTagToTaskInput(BaseModel):
     """Input para adicionar tag a uma task."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     task_id: str = Field(..., description="ID da task", min_length=1, pattern=CLICKUP_ID_PATTERN)
     tag_name: str = Field(..., description="Nome da tag a adicionar", min_length=1)
 
@@ -3698,7 +3786,7 @@ async def add_tag_to_task(params: AddTagToTaskInput) -> str:
 
 class RemoveTagFromTaskInput(BaseModel):
     """Input para remover tag de uma task."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     task_id: str = Field(..., description="ID da task", min_length=1, pattern=CLICKUP_ID_PATTERN)
     tag_name: str = Field(..., description="Nome da tag a remover", min_length=1)
 
@@ -3733,7 +3821,7 @@ async def remove_tag_from_task(params: RemoveTagFromTaskInput) -> str:
 
 class AddDependencyInput(BaseModel):
     """Input para adicionar dependência entre tasks."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     task_id: str = Field(..., description="ID da task que terá a dependência", min_length=1, pattern=CLICKUP_ID_PATTERN)
     depends_on: str = Field(..., description="ID da task da qual depende", min_length=1)
 
@@ -3767,7 +3855,7 @@ async def add_dependency(params: AddDependencyInput) -> str:
 
 class DeleteDependencyInput(BaseModel):
     """Input para remover dependência entre tasks."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     task_id: str = Field(..., description="ID da task que tem a dependência", min_length=1, pattern=CLICKUP_ID_PATTERN)
     depends_on: str = Field(..., description="ID da task da qual dependia", min_length=1)
 
@@ -3798,7 +3886,7 @@ async def delete_dependency(params: DeleteDependencyInput) -> str:
 
 class AddTaskLinkInput(BaseModel):
     """Input para criar link entre tasks."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     task_id: str = Field(..., description="ID da task origem", min_length=1, pattern=CLICKUP_ID_PATTERN)
     links_to: str = Field(..., description="ID da task destino", min_length=1)
 
@@ -3832,7 +3920,7 @@ async def add_task_link(params: AddTaskLinkInput) -> str:
 
 class DeleteTaskLinkInput(BaseModel):
     """Input para remover link entre tasks."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     task_id: str = Field(..., description="ID da task origem", min_length=1, pattern=CLICKUP_ID_PATTERN)
     links_to: str = Field(..., description="ID da task destino", min_length=1)
 
@@ -3867,7 +3955,7 @@ async def delete_task_link(params: DeleteTaskLinkInput) -> str:
 
 class CreateChecklistInput(BaseModel):
     """Input para criar checklist em uma task."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     task_id: str = Field(..., description="ID da task", min_length=1, pattern=CLICKUP_ID_PATTERN)
     name: str = Field(..., description="Nome do checklist", min_length=1, max_length=200)
 
@@ -3902,7 +3990,7 @@ async def create_checklist(params: CreateChecklistInput) -> str:
 
 class UpdateChecklistInput(BaseModel):
     """Input para atualizar checklist."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     checklist_id: str = Field(..., description="ID do checklist", min_length=1, pattern=CLICKUP_ID_PATTERN)
     name: Optional[str] = Field(default=None, description="Novo nome do checklist")
     position: Optional[int] = Field(default=None, description="Nova posição (ordem)")
@@ -3941,7 +4029,7 @@ async def update_checklist(params: UpdateChecklistInput) -> str:
 
 class DeleteChecklistInput(BaseModel):
     """Input para deletar checklist."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     checklist_id: str = Field(..., description="ID do checklist a deletar", min_length=1, pattern=CLICKUP_ID_PATTERN)
 
 
@@ -3971,7 +4059,7 @@ async def delete_checklist(params: DeleteChecklistInput) -> str:
 
 class CreateChecklistItemInput(BaseModel):
     """Input para criar item em checklist."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     checklist_id: str = Field(..., description="ID do checklist", min_length=1, pattern=CLICKUP_ID_PATTERN)
     name: str = Field(..., description="Nome/texto do item", min_length=1, max_length=500)
     assignee: Optional[int] = Field(default=None, description="ID do responsável pelo item")
@@ -4011,7 +4099,7 @@ async def create_checklist_item(params: CreateChecklistItemInput) -> str:
 
 class UpdateChecklistItemInput(BaseModel):
     """Input para atualizar item do checklist."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     checklist_id: str = Field(..., description="ID do checklist", min_length=1, pattern=CLICKUP_ID_PATTERN)
     checklist_item_id: str = Field(..., description="ID do item", min_length=1, pattern=CLICKUP_ID_PATTERN)
     name: Optional[str] = Field(default=None, description="Novo nome/texto do item")
@@ -4059,7 +4147,7 @@ async def update_checklist_item(params: UpdateChecklistItemInput) -> str:
 
 class DeleteChecklistItemInput(BaseModel):
     """Input para deletar item do checklist."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     checklist_id: str = Field(..., description="ID do checklist", min_length=1, pattern=CLICKUP_ID_PATTERN)
     checklist_item_id: str = Field(..., description="ID do item a deletar", min_length=1, pattern=CLICKUP_ID_PATTERN)
 
@@ -4094,7 +4182,7 @@ async def delete_checklist_item(params: DeleteChecklistItemInput) -> str:
 
 class StartTimeEntryInput(BaseModel):
     """Input para iniciar timer."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     team_id: str = Field(..., description="ID do workspace/team", min_length=1, pattern=CLICKUP_ID_PATTERN)
     task_id: Optional[str] = Field(default=None, description="ID da task (opcional)")
     description: Optional[str] = Field(default=None, description="Descrição do que está fazendo")
@@ -4137,7 +4225,7 @@ async def start_timer(params: StartTimeEntryInput) -> str:
 
 class StopTimeEntryInput(BaseModel):
     """Input para parar timer."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     team_id: str = Field(..., description="ID do workspace/team", min_length=1, pattern=CLICKUP_ID_PATTERN)
 
 
@@ -4171,7 +4259,7 @@ async def stop_timer(params: StopTimeEntryInput) -> str:
 
 class GetRunningTimeEntryInput(BaseModel):
     """Input para obter timer em execução."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     team_id: str = Field(..., description="ID do workspace/team", min_length=1, pattern=CLICKUP_ID_PATTERN)
 
 
@@ -4212,7 +4300,7 @@ async def get_running_timer(params: GetRunningTimeEntryInput) -> str:
 
 class GetTaskTemplatesInput(BaseModel):
     """Input para listar templates de tasks."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     team_id: str = Field(..., description="ID do workspace/team", min_length=1, pattern=CLICKUP_ID_PATTERN)
     page: int = Field(default=0, description="Página de resultados (começa em 0)")
     output_mode: OutputMode = Field(default=OutputMode.COMPACT, description="Modo de output")
@@ -4239,7 +4327,7 @@ async def get_task_templates(params: GetTaskTemplatesInput) -> str:
         templates = data.get("templates", [])
 
         if params.output_mode == OutputMode.JSON:
-            return json.dumps(data, indent=2, ensure_ascii=False)
+            return to_json(data)
 
         if not templates:
             return "Nenhum template encontrado."
@@ -4265,7 +4353,7 @@ async def get_task_templates(params: GetTaskTemplatesInput) -> str:
 
 class CreateTaskFromTemplateInput(BaseModel):
     """Input para criar task a partir de template."""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
     list_id: str = Field(..., description="ID da list onde criar a task", min_length=1, pattern=CLICKUP_ID_PATTERN)
     template_id: str = Field(..., description="ID do template", min_length=1, pattern=CLICKUP_ID_PATTERN)
     name: str = Field(..., description="Nome da nova task", min_length=1, max_length=500)
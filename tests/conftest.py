@@ -2,6 +2,34 @@
 Fixtures para testes do MCP ClickUp.
 """
 import pytest
+import respx
+
+
+@pytest.fixture(scope="session", autouse=True)
+def respx_router():
+    """Instala o transport mock do respx uma única vez por sessão."""
+    respx.mock.start()
+    yield respx.mock
+    respx.mock.stop(quiet=True)
+
+
+@pytest.fixture(autouse=True)
+def mock_api(request, respx_router):
+    """
+    Isola as rotas do router global a cada teste (equivalente a @respx.mock).
+
+    Rotas registradas no teste são descartadas no teardown. Mantém
+    assert_all_called, exceto quando o próprio teste já falhou.
+    """
+    failed_before = request.session.testsfailed
+    respx_router.snapshot()
+    try:
+        yield respx_router
+        if request.session.testsfailed == failed_before:
+            respx_router.assert_all_called()
+    finally:
+        respx_router.rollback()
+        respx_router.reset()
 
 
 @pytest.fixture
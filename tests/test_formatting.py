@@ -21,6 +21,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 from clickup_mcp import (
     extract_tipo_subtipo,
     format_timestamp,
+    _format_timestamp_ms,
     format_tasks_compact,
     format_tasks_detailed,
     OutputMode,
@@ -66,6 +67,12 @@ class TestExtractTipoSubtipo:
         assert tipo == "Pedido de Registro"
         assert subtipo == "INPI"
 
+    def test_hifen_sem_espacos_nao_separa(self):
+        """Hífen dentro de palavra não é separador de tipo/subtipo."""
+        tipo, subtipo = extract_tipo_subtipo("Pré-contrato - Empresarial")
+        assert tipo == "Pré-contrato"
+        assert subtipo == "Empresarial"
+
 
 class TestFormatTimestamp:
     """Testes para formatação de timestamps."""
@@ -88,6 +95,16 @@ class TestFormatTimestamp:
         result = format_timestamp("invalid")
         assert result == "invalid"
 
+    def test_timestamp_string_usa_mesmo_cache(self):
+        """Timestamp em string (como vem da API) deve reaproveitar o cache do int."""
+        _format_timestamp_ms.cache_clear()
+        assert format_timestamp("1704067200000") == format_timestamp(1704067200000)
+        assert _format_timestamp_ms.cache_info().hits == 1
+
+    def test_timestamp_fora_do_range(self):
+        """Timestamp fora do range de datas deve voltar como string."""
+        assert format_timestamp(10 ** 20) == str(10 ** 20)
+
 
 class TestFormatTasksCompact:
     """Testes para formatação compacta de tasks."""
@@ -204,6 +221,11 @@ class TestCache:
         assert key1 != key2
         assert key1 == key3
 
+    def test_cache_key_ignores_param_order(self):
+        """Ordem dos params não deve alterar a chave."""
+        assert cache_key("/test", {"a": 1, "b": [2, 3]}) == cache_key("/test", {"b": [2, 3], "a": 1})
+        assert cache_key("/test") == cache_key("/test", {})
+
     def test_set_and_get_cached(self):
         """Deve armazenar e recuperar do cache."""
         test_data = {"test": "data"}